@@ -20,10 +20,7 @@ logger = logging.getLogger(__name__)
 # Try to import optional modules
 try:
     import win32gui
-    import win32con
-    import win32api
     import win32ui
-    from win32com.shell import shell, shellcon
 
     WINDOWS_MODULES_AVAILABLE = True
 except ImportError:
@@ -354,7 +351,7 @@ class EnhancedExecutionLogger:
 
             self.logs.insert(0, log_entry)
             if len(self.logs) > self.max_logs:
-                self.logs = self.logs[: self.max_logs]
+                del self.logs[self.max_logs :]
 
             self.save_logs()
         except Exception as e:
@@ -460,14 +457,24 @@ class EnhancedExecutionLogger:
         if not self.logs:
             return {}
 
+        # Single pass over the history. Timestamps use a fixed-width
+        # "%Y-%m-%d %H:%M:%S" format, so string comparison orders them
+        # chronologically without parsing every entry.
+        recent_cutoff = (datetime.now() - timedelta(hours=24)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
         total_executions = len(self.logs)
-        successful = len([log for log in self.logs if log.get("status") == "success"])
+        successful = 0
+        python_executions = 0
+        recent_executions = 0
+        for log in self.logs:
+            if log.get("status") == "success":
+                successful += 1
+            if log.get("file_type") == ".py":
+                python_executions += 1
+            if log.get("timestamp", "") > recent_cutoff:
+                recent_executions += 1
         failed = total_executions - successful
-        python_executions = len(
-            [log for log in self.logs if log.get("file_type") == ".py"]
-        )
-        recent_logs = self.get_logs("recent")
-        recent_executions = len(recent_logs)
 
         return {
             "total_executions": total_executions,
@@ -2200,7 +2207,7 @@ class ModernTaskbar:
         self.update_status_indicator()
 
         def run_execution():
-            start_time = time.time()
+            start_time = time.monotonic()
             file_path = item_data.get("path", "")
             item_type = item_data.get("type", "file")
             item_name = item_data.get("name", "Unknown")
@@ -2247,7 +2254,7 @@ class ModernTaskbar:
                             errors="replace",
                         )
 
-                    execution_time = time.time() - start_time
+                    execution_time = time.monotonic() - start_time
                     self.execution_logger.add_log(
                         item_name,
                         command,
@@ -2307,7 +2314,7 @@ class ModernTaskbar:
                     elif file_path.endswith(".exe"):
                         command = f'"{file_path}"'
                         subprocess.Popen([file_path])
-                        execution_time = time.time() - start_time
+                        execution_time = time.monotonic() - start_time
                         self.execution_logger.add_log(
                             item_name,
                             command,
@@ -2331,7 +2338,7 @@ class ModernTaskbar:
                             env=env,
                         )
 
-                    execution_time = time.time() - start_time
+                    execution_time = time.monotonic() - start_time
                     status = "success" if result.returncode == 0 else "error"
                     self.execution_logger.add_log(
                         item_name,
@@ -2352,7 +2359,7 @@ class ModernTaskbar:
                         command = f'xdg-open "{file_path}"'
                         subprocess.run(["xdg-open", file_path])
 
-                    execution_time = time.time() - start_time
+                    execution_time = time.monotonic() - start_time
                     self.execution_logger.add_log(
                         item_name,
                         command,
@@ -2364,7 +2371,7 @@ class ModernTaskbar:
                     self.update_status_indicator_with_result("success")
 
             except subprocess.TimeoutExpired:
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 self.execution_logger.add_log(
                     item_name,
                     command,
@@ -2375,7 +2382,7 @@ class ModernTaskbar:
                 )
                 self.update_status_indicator_with_result("error")
             except Exception as e:
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 self.execution_logger.add_log(
                     item_name,
                     command,